@@ -226,7 +226,7 @@ class ConsoleWindow(QMainWindow):
         self.event_table.cellChanged.connect(self.cell_changed)
 
         # Store the *current* list of events received from the scheduler
-        self._current_events: list[Event] = []
+        self._current_events: tuple[Event, ...] = ()
         # Flags to prevent recursive updates during table population/highlighting
         self._is_updating_table = False
         self._is_highlighting = False
@@ -251,7 +251,7 @@ class ConsoleWindow(QMainWindow):
 
     # --- Slots for EventScheduler Signals ---
 
-    def update_events_display(self, events: list[Event]):
+    def update_events_display(self, events: tuple[Event, ...]):
         """
         Slot connected to EventScheduler.all_events_signal.
         Updates the internal event list and refreshes the table display.
@@ -267,13 +267,7 @@ class ConsoleWindow(QMainWindow):
             self.event_table.insertRow(i)
 
             # Format time (handle None for unscheduled events)
-            if event.time is None:
-                formatted_date = UNSCHEDULED
-                formatted_time = EMPTY_TIME  # Keep time blank for unscheduled
-            else:
-                dt = event.time
-                formatted_date = dt.strftime("%Y-%m-%d")
-                formatted_time = dt.strftime("%H:%M:%S")
+            formatted_date, formatted_time = self._format_event_time(event)
 
             # Create order item (initially empty)
             order_item = QTableWidgetItem("")
@@ -318,6 +312,50 @@ class ConsoleWindow(QMainWindow):
         # Re-apply highlighting and order numbers based on the potentially updated current_index
         self._update_visual_state()
 
+    def update_event_row(self, index: int):
+        """
+        Slot connected to EventScheduler.event_changed.
+        Refreshes the text of one row in place after an edit that did not move
+        the event, instead of rebuilding the whole table.
+        """
+        if not (0 <= index < len(self._current_events)):
+            return
+
+        event = self._current_events[index]
+        formatted_date, formatted_time = self._format_event_time(event)
+
+        self._is_updating_table = True  # Prevent cellChanged while setting text
+        for column, text in (
+            (1, formatted_date),
+            (2, formatted_time),
+            (3, event.video_path),
+            (4, event.title),
+            (5, event.description),
+        ):
+            item = self.event_table.item(index, column)
+            if item and item.text() != text:
+                item.setText(text)
+
+        video_item = self.event_table.item(index, 3)
+        if video_item:
+            if event.video_path and not os.path.isfile(event.video_path):
+                video_item.setForeground(QBrush(QColor("#FF0000")))
+            else:
+                video_item.setForeground(QBrush())
+        self._is_updating_table = False
+
+        # Keep the visual window in sync if the current event was edited
+        if index == self._current_event_index:
+            self.text_updated.emit(event.title, event.description)
+
+    @staticmethod
+    def _format_event_time(event: Event) -> tuple[str, str]:
+        """Returns the (date, time) cell texts for an event."""
+        if event.time is None:
+            return UNSCHEDULED, EMPTY_TIME  # Keep time blank for unscheduled
+        dt = event.time
+        return dt.strftime("%Y-%m-%d"), dt.strftime("%H:%M:%S")
+
     def update_current_event(self, index: int):
         """
         Slot connected to EventScheduler.current_event_signal.
@@ -393,7 +431,7 @@ class ConsoleWindow(QMainWindow):
                 order_item.setText("")
 
         # Get current time for comparison
-        now = datetime.now().replace(tzinfo=None)
+        now = datetime.now()
 
         # If there's no valid current event, we can't calculate relative order easily
         if self._current_event_index < 0 or self._current_event_index >= len(
@@ -14,8 +14,57 @@ class CSVManager:
             csv_path: Path to the CSV file
             events: List of Event objects
         """
+        return CSVManager.save_rows(csv_path, CSVManager.events_to_rows(events))
+
+    @staticmethod
+    def events_to_rows(events):
+        """
+        Convert events to CSV rows, detached from the Event objects.
+
+        Args:
+            events: List of Event objects
+
+        Returns:
+            List of rows (Date, Time, Video, Title, Description)
+        """
+        rows = []
+        for event in events:
+            # Check for unscheduled events
+            time_iso = event.time_iso
+            if time_iso is None:
+                # This is an unscheduled event
+                date_str = ""
+                time_str = ""
+            else:
+                # Split the cached "YYYY-MM-DDTHH:MM:SS[.ffffff]" string
+                date_str = time_iso[:10]
+                time_str = time_iso[11:19]
+
+            rows.append(
+                [
+                    date_str,
+                    time_str,
+                    event.video_path,
+                    event.title,
+                    event.description,
+                ]
+            )
+
+        return rows
+
+    @staticmethod
+    def save_rows(csv_path, rows):
+        """
+        Save rows produced by events_to_rows to a CSV file.
+
+        Args:
+            csv_path: Path to the CSV file
+            rows: List of rows from events_to_rows
+        """
         # Ensure directory exists
-        os.makedirs(os.path.dirname(csv_path), exist_ok=True)
+        directory = os.path.dirname(csv_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
 
         # Write to CSV
         with open(csv_path, "w", newline="") as f:
@@ -25,26 +74,7 @@ class CSVManager:
             writer.writerow(["Date", "Time", "Video", "Title", "Description"])
 
             # Write events
-            for event in events:
-                # Check for unscheduled events
-                if event.time is None:
-                    # This is an unscheduled event
-                    date_str = ""
-                    time_str = ""
-                else:
-                    # Parse the datetime to separate date and time
-                    date_str = event.time.strftime("%Y-%m-%d")
-                    time_str = event.time.strftime("%H:%M:%S")
-
-                writer.writerow(
-                    [
-                        date_str,
-                        time_str,
-                        event.video_path,
-                        event.title,
-                        event.description,
-                    ]
-                )
+            writer.writerows(rows)
 
         return True
 
@@ -58,10 +88,11 @@ class CSVManager:
 
         Returns:
             List of Event objects
-        """
-        if not os.path.exists(csv_path):
-            return []
 
+        Raises:
+            FileNotFoundError: If the CSV file does not exist
+            ValueError: If a row is missing required fields or has a bad date/time
+        """
         events = []
         with open(csv_path, "r") as f:
             reader = csv.DictReader(f)
@@ -104,17 +135,17 @@ class CSVManager:
                 if date_str:
                     iso_time = f"{date_str}T{time_str}"
                 else:
-                    today = datetime.now().replace(tzinfo=None).strftime("%Y-%m-%d")
+                    today = datetime.now().strftime("%Y-%m-%d")
                     iso_time = f"{today}T{time_str}"
 
-                # Validate the complete datetime
+                # Validate the complete datetime, and keep it so Event need not re-parse
                 try:
-                    datetime.fromisoformat(iso_time)
+                    event_time = datetime.fromisoformat(iso_time)
                 except ValueError:
                     raise ValueError(f"Invalid time format in CSV: {time_str}")
 
                 event = Event(
-                    time_str=iso_time,
+                    time_str=event_time,
                     video_path=row.get("Video", ""),
                     title=row["Title"].strip(),
                     description=row["Description"].strip(),
@@ -1,36 +1,69 @@
 from datetime import datetime
-from dateutil import parser
+import functools
+import re
 import sys
 
+# Prefix of the strings datetime.isoformat() and the CSV loader produce
+_ISO_DATETIME_RE = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}")
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_time(time_str: str) -> datetime:
+    """
+    Parses an event time string into a naive datetime.
+    Results are memoized; datetimes are immutable, so events can share them.
+
+    Args:
+        time_str: The time string, normally ISO 8601.
+
+    Returns:
+        datetime: The parsed time without timezone info.
+
+    Raises:
+        ValueError, TypeError: If the string cannot be parsed.
+    """
+    dt = None
+    if _ISO_DATETIME_RE.match(time_str):
+        # Fast path: our own canonical format, no need for guessing
+        try:
+            dt = datetime.fromisoformat(time_str)
+        except ValueError:
+            # ISO-looking but not strict ISO (e.g. "...T09:30:00 PM"); let dateutil try
+            pass
+    if dt is None:
+        # dateutil is only needed for non-ISO input, so only import it then
+        from dateutil import parser
+
+        dt = parser.parse(time_str, fuzzy=False)
+    # Ensure naive datetime (no timezone info) for consistent comparison
+    return dt.replace(tzinfo=None)
+
 
 class Event:
     """Represents a single event with time, video, title, and description."""
 
+    __slots__ = ("_time", "_time_iso", "_video_path", "_title", "_description")
+
     def __init__(
-        self, time_str: str | None, video_path: str, title: str, description: str
+        self,
+        time_str: str | datetime | None,
+        video_path: str,
+        title: str,
+        description: str,
     ):
         """
         Initializes an Event object.
 
         Args:
-            time_str: The ISO 8601 formatted time string, or None for unscheduled events.
+            time_str: The ISO 8601 formatted time string, an already-parsed datetime,
+                or None for unscheduled events.
             video_path: Path to the video file.
             title: Title of the event.
             description: Description of the event.
         """
         self._time: datetime | None = None
-        if time_str:
-            try:
-                dt = parser.parse(time_str, fuzzy=False)
-                # Ensure naive datetime (no timezone info) for consistent comparison
-                self._time = dt.replace(tzinfo=None)
-            except (ValueError, TypeError) as e:
-                print(
-                    f"Error parsing date '{time_str}': {e}. Treating as unscheduled.",
-                    file=sys.stderr,
-                )
-                # Keep self._time as None if parsing fails
-
+        self._time_iso: str | None = None
+        self.set_time(time_str)
         self._video_path = video_path
         self._title = title
         self._description = description
@@ -43,25 +76,34 @@ class Event:
     @property
     def time_iso(self) -> str | None:
         """Get the ISO-formatted time string, or None if unscheduled."""
-        return self._time.isoformat() if self._time else None
+        return self._time_iso
 
-    def set_time(self, time_str: str | None) -> None:
+    def set_time(self, time_str: str | datetime | None) -> None:
         """
         Set the time from an ISO 8601 formatted string or None for unscheduled events.
 
         Args:
-            time_str: The ISO 8601 formatted time string, or None for unscheduled events.
+            time_str: The ISO 8601 formatted time string, an already-parsed datetime,
+                or None for unscheduled events.
         """
         self._time = None
-        if time_str:
+        if isinstance(time_str, datetime):
+            # Already parsed by the caller; only ensure it is naive
+            self._time = (
+                time_str if time_str.tzinfo is None else time_str.replace(tzinfo=None)
+            )
+        elif time_str:
             try:
-                dt = parser.parse(time_str, fuzzy=False)
-                self._time = dt.replace(tzinfo=None)
+                self._time = _parse_time(time_str)
             except (ValueError, TypeError) as e:
                 print(
                     f"Error parsing date '{time_str}': {e}. Treating as unscheduled.",
                     file=sys.stderr,
                 )
+                # Keep self._time as None if parsing fails
+
+        # Formatted once here since saves read it for every event
+        self._time_iso = self._time.isoformat() if self._time else None
 
     @property
     def video_path(self) -> str:
@@ -108,6 +150,6 @@ class Event:
             return None
 
         if reference_time is None:
-            reference_time = datetime.now().replace(tzinfo=None)
+            reference_time = datetime.now()
 
         return (self._time - reference_time).total_seconds() 
\ No newline at end of file
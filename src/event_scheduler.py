@@ -1,12 +1,32 @@
-import os
+import bisect
+import math
 from datetime import datetime
 import sys
+import threading
+import time
 
-from PySide6.QtCore import QObject, Signal, QTimer
+from PySide6.QtCore import QObject, Signal, QTimer, QRunnable, QThreadPool
 
 from src.csv_manager import CSVManager
 from src.event import Event
-from .strings import APP_NAME, NO_ACTIVE_EVENT
+from .strings import APP_NAME, NO_ACTIVE_EVENT, UNSCHEDULED
+
+# Quiet period after the last edit before the CSV is written
+_SAVE_DEBOUNCE_MS = 250
+
+# Date/time cell value (compared case-insensitively) that unschedules an event
+_UNSCHEDULED_VALUE = UNSCHEDULED.lower()
+
+
+class _CSVSaveTask(QRunnable):
+    """Runs a queued CSV write on a worker thread."""
+
+    def __init__(self, write):
+        super().__init__()
+        self._write = write
+
+    def run(self):
+        self._write()
 
 
 class EventScheduler(QObject):
@@ -29,11 +49,14 @@ class EventScheduler(QObject):
     """
 
     update_countdown = Signal(int)  # seconds_remaining
-    """Emitted every second while counting down to the next event."""
+    """Emitted on each whole-second boundary while counting down to the next event."""
 
-    all_events_signal = Signal(list)  # list of Event objects
+    all_events_signal = Signal(tuple)  # immutable snapshot of Event objects
     """Emitted when the event list is loaded or modified."""
 
+    event_changed = Signal(int)  # index of the edited event in self.events
+    """Emitted when one event's fields change without it moving in the list."""
+
     current_event_signal = Signal(int)  # index of current event in self.events
     """Emitted when the currently active event changes."""
 
@@ -48,17 +71,36 @@ class EventScheduler(QObject):
         self.events: list[Event] = []  # Combined list, sorted scheduled first
         self.scheduled_events: list[Event] = []  # Events with times, sorted
         self.unscheduled_events: list[Event] = []  # Events without times
+        self._scheduled_times: list[datetime] = []  # Parallel to scheduled_events
+        self._index_by_id: dict[int, int] = {}  # id(event) -> index in self.events
+        self._events_snapshot: tuple[Event, ...] | None = None  # tuple(self.events)
         self.current_event_index: int = -1  # Index in the combined self.events list
         self._active_event_object: Event | None = (
             None  # The event currently playing/just finished
         )
 
-        self.schedule_check_timer = QTimer(self)
-        self.schedule_check_timer.timeout.connect(self._check_schedule)
+        # Single-shot timer re-armed for each whole second left before the next
+        # event's deadline; it also starts that event once the deadline passes.
         self.countdown_timer = QTimer(self)
+        self.countdown_timer.setSingleShot(True)
         self.countdown_timer.timeout.connect(self._tick_countdown)
+        self._countdown_event: Event | None = None  # Event the countdown targets
+        self._countdown_deadline: float = 0.0  # Its start time as epoch seconds
         self.csv_path: str | None = None
 
+        # CSV writes run off the GUI thread. A single worker keeps them ordered,
+        # and saves requested while one is queued replace its payload.
+        self._save_pool = QThreadPool(self)
+        self._save_pool.setMaxThreadCount(1)
+        self._save_lock = threading.Lock()
+        self._pending_save: tuple[str, list[list[str]]] | None = None
+        # Restarted by every edit so a burst of edits is written once
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.timeout.connect(self.save_to_csv)
+
+        self._update_signals_pending = False  # A deferred UI refresh is queued
+
         # Connect internal request signals to handlers
         self.request_add_event.connect(self.add_event_data)
         self.request_remove_event.connect(self.remove_event_at_index)
@@ -74,17 +116,22 @@ class EventScheduler(QObject):
 
         Args:
             csv_path: Path to the CSV file.
+
+        Raises:
+            OSError: If the CSV file cannot be opened (e.g. it does not exist).
+            ValueError: If the CSV file contents are invalid.
         """
-        if not os.path.exists(csv_path):
+        try:
+            events = CSVManager.load_events(csv_path)
+        except FileNotFoundError:
             print(f"Error: CSV file not found: {csv_path}", file=sys.stderr)
-            exit(1)
+            raise
+        except (OSError, ValueError) as e:
+            print(f"Error loading CSV file '{csv_path}': {e}", file=sys.stderr)
+            raise
 
         self.csv_path = csv_path
-        try:
-            self.events = CSVManager.load_events(csv_path)
-        except ValueError as e:
-            print(f"Error loading CSV file '{csv_path}': {e}", file=sys.stderr)
-            exit(1)
+        self.events = events
 
         self.scheduled_events = []
         self.unscheduled_events = []
@@ -102,7 +149,7 @@ class EventScheduler(QObject):
         self.scheduled_events.sort(key=lambda x: x.time)
 
         # Rebuild the main events list: sorted scheduled events followed by unscheduled
-        self.events = self.scheduled_events + self.unscheduled_events
+        self._rebuild_events()
 
         # Signal the UI about the updated list
         self._emit_update_signals()
@@ -116,96 +163,36 @@ class EventScheduler(QObject):
 
         Finds the most recently passed event (if any) to set the initial state,
         then finds the next upcoming event and starts the countdown.
-        Starts the main timer to check for scheduled event times.
         """
         if not self.events:
             print("No events loaded.")
             self.event_finished.emit("No events", 0, "SBDStream", "Load a CSV file.")
             return
 
-        now = datetime.now().replace(tzinfo=None)
-        most_recent_past_scheduled_event: Event | None = None
-        most_recent_past_scheduled_event_index_in_all: int = -1
+        now = datetime.now()
 
-        # Find the most recent past *scheduled* event to define the starting "current" state
-        for i, event in enumerate(self.scheduled_events):
-            if event.time <= now:
-                most_recent_past_scheduled_event = event
-            else:
-                # Since scheduled_events is sorted, we can stop early
-                break
-
-        if most_recent_past_scheduled_event:
-            # Find its index in the combined list
-            try:
-                most_recent_past_scheduled_event_index_in_all = self.events.index(
-                    most_recent_past_scheduled_event
-                )
-                self.current_event_index = most_recent_past_scheduled_event_index_in_all
-                self._active_event_object = (
-                    most_recent_past_scheduled_event  # Set the initial active event
-                )
-                self.current_event_signal.emit(self.current_event_index)
-                print(f"Starting after event: {self._active_event_object.title}")
-            except ValueError:
-                # Should not happen if lists are consistent
-                print(
-                    "Error: Could not find last past event in the main list.",
-                    file=sys.stderr,
-                )
-                self.current_event_index = -1
-                self._active_event_object = None
-                self.current_event_signal.emit(
-                    self.current_event_index
-                )  # Emit update even on error
+        # Find the most recent past *scheduled* event to define the starting "current" state.
+        most_recent_past_scheduled_event_index_in_all, _ = self._schedule_position(now)
+
+        if most_recent_past_scheduled_event_index_in_all >= 0:
+            self.current_event_index = most_recent_past_scheduled_event_index_in_all
+            self._active_event_object = self.scheduled_events[
+                most_recent_past_scheduled_event_index_in_all
+            ]  # Set the initial active event
+            print(f"Starting after event: {self._active_event_object.title}")
         else:
             print("No past scheduled events found.")
             # If no past event, the initial "current" state is effectively before the first event.
             self.current_event_index = -1
             self._active_event_object = None
-            self.current_event_signal.emit(self.current_event_index)  # Emit update
-
-        # Setup countdown to the *next* scheduled event and start checking timer
-        self._update_state_after_event()
-        self.schedule_check_timer.start(1000)  # Check every second
-        print("Event scheduler started.")
 
-    def _check_schedule(self):
-        """
-        Checks if the next scheduled event's time has arrived.
-
-        This is called periodically by `schedule_check_timer`.
-        If a new event should start, it stops the countdown and starts the event.
-        """
-        now = datetime.now().replace(tzinfo=None)
-        next_event, next_event_index_in_all = self._find_next_scheduled_event(now)
-
-        if not next_event or next_event.time > now:
-            return
-
-        # Time for the next scheduled event has arrived.
-        # Check if it's different from the currently active event (if any)
-        # or if no event is active.
-        is_new_event = (
-            self._active_event_object is None
-            or next_event is not self._active_event_object
-        )
-
-        if not is_new_event:
-            return
-
-        print(f"Scheduled event starting: {next_event.title}")
-        if self.countdown_timer.isActive():
-            self.countdown_timer.stop()
-            self.seconds_to_next = 0  # Reset countdown
-
-        self.current_event_index = next_event_index_in_all
-        self._active_event_object = next_event  # Update active event
+        # Publish the loaded list along with the current index; the UI may have been
+        # connected only after the events were loaded
+        self._emit_update_signals()
 
-        self.event_started.emit(
-            next_event.video_path, next_event.title, next_event.description
-        )
-        self.current_event_signal.emit(self.current_event_index)
+        # Setup countdown to the *next* scheduled event
+        self._update_state_after_event(now)
+        print("Event scheduler started.")
 
     def trigger_event(self, event_index: int):
         """
@@ -227,9 +214,9 @@ class EventScheduler(QObject):
             f"Manually triggering event: {triggered_event.title} (Index: {event_index})"
         )
 
-        if self.countdown_timer.isActive():
-            self.countdown_timer.stop()
-            self.seconds_to_next = 0  # Reset countdown
+        # Drop the countdown; it is re-armed once the triggered video finishes
+        self._countdown_event = None
+        self.countdown_timer.stop()
 
         self.current_event_index = event_index
         self._active_event_object = triggered_event  # Update active event
@@ -256,14 +243,18 @@ class EventScheduler(QObject):
             # Still try to update state in case something went wrong
         self._update_state_after_event()
 
-    def _update_state_after_event(self):
+    def _update_state_after_event(self, now: datetime | None = None):
         """
         Finds the next scheduled event and emits `event_finished` to start the countdown.
 
         This is called by `start()`, `handle_video_finished()`.
         It sets up the transition *to* the next event's waiting period.
+
+        Args:
+            now: The current time, if the caller already has it.
         """
-        now = datetime.now().replace(tzinfo=None)
+        if now is None:
+            now = datetime.now()
         next_event, next_index = self.next_event(now)
 
         current_title = "SBDStream"
@@ -275,6 +266,7 @@ class EventScheduler(QObject):
         if not next_event:
             # No more scheduled events
             print("No more scheduled events.")
+            self._countdown_event = None
             if self.countdown_timer.isActive():
                 self.countdown_timer.stop()
             self.event_finished.emit(
@@ -285,7 +277,8 @@ class EventScheduler(QObject):
             )
             return
 
-        seconds_to_next = int(next_event.seconds_until(now))
+        seconds_remaining = next_event.seconds_until(now)
+        seconds_to_next = math.ceil(seconds_remaining)
         print(f"Next scheduled event: '{next_event.title}' in {seconds_to_next}s")
         self.event_finished.emit(
             next_event.title,
@@ -293,10 +286,21 @@ class EventScheduler(QObject):
             current_title,
             current_description,
         )
-        if seconds_to_next > 0 and not self.countdown_timer.isActive():
-            self.countdown_timer.start(1000)
-        elif seconds_to_next <= 0 and self.countdown_timer.isActive():
-            self.countdown_timer.stop()  # Stop if already passed
+        self._countdown_event = next_event
+        # Ticks compare epoch floats, which is cheaper than datetime arithmetic
+        self._countdown_deadline = next_event.time.timestamp()
+        self._arm_countdown(seconds_remaining)
+
+    def _arm_countdown(self, seconds_remaining: float):
+        """
+        Arms `countdown_timer` to fire at the next whole-second boundary before
+        the deadline, so displayed seconds never drift from the event time.
+
+        Args:
+            seconds_remaining: Seconds left until the targeted event starts.
+        """
+        ms_remaining = max(0, math.ceil(seconds_remaining * 1000))
+        self.countdown_timer.start(ms_remaining % 1000 or min(ms_remaining, 1000))
 
     def _find_next_scheduled_event(
         self, reference_time: datetime
@@ -311,45 +315,50 @@ class EventScheduler(QObject):
             A tuple containing the next Event object (or None) and its index
             in the main `self.events` list (-1 if not found).
         """
-        next_scheduled_event = None
-        for event in self.scheduled_events:
-            if event.time > reference_time:
-                next_scheduled_event = event
-                break
-
-        if not next_scheduled_event:
+        _, index = self._schedule_position(reference_time)
+        if index == -1:
             return None, -1  # No more scheduled events
+        return self.scheduled_events[index], index
 
-        try:
-            index_in_all = self.events.index(next_scheduled_event)
-            return next_scheduled_event, index_in_all
-        except ValueError:
-            print(
-                f"Error: Could not find next scheduled event '{next_scheduled_event.title}' in main list.",
-                file=sys.stderr,
-            )
-            return None, -1  # Consistency issue
+    def _schedule_position(self, reference_time: datetime) -> tuple[int, int]:
+        """
+        Locates the reference time among the scheduled events with one bisect.
 
-    def _tick_countdown(self):
-        """Decrements the countdown timer and emits the update signal."""
-        now = datetime.now().replace(tzinfo=None)
-        next_event, next_index = self.next_event(now)
+        Scheduled events lead `self.events`, so the returned positions are also
+        indices in the combined list.
 
-        if not next_event:
-            self.countdown_timer.stop()
+        Args:
+            reference_time: The time to locate.
+
+        Returns:
+            tuple[int, int]: The index of the most recent event at or before the
+            reference time and of the first event after it, each -1 if there is none.
+        """
+        index = bisect.bisect_right(self._scheduled_times, reference_time)
+        next_index = index if index < len(self._scheduled_times) else -1
+        return index - 1, next_index
+
+    def _tick_countdown(self):
+        """
+        Emits the remaining seconds to the targeted event and re-arms the timer,
+        or starts the event once its deadline has been reached.
+        """
+        next_event = self._countdown_event
+        if next_event is None:
             return
 
-        seconds_to_next = int(next_event.seconds_until(now))
-        if seconds_to_next > 0:
-            self.update_countdown.emit(seconds_to_next)
+        seconds_remaining = self._countdown_deadline - time.time()
+        if seconds_remaining > 0:
+            self.update_countdown.emit(math.ceil(seconds_remaining))
+            self._arm_countdown(seconds_remaining)
             return
 
         # Countdown reached zero, trigger the next event
-        self.countdown_timer.stop()
+        self._countdown_event = None
         print(f"Countdown reached zero, triggering event: {next_event.title}")
 
         # Update current event state
-        self.current_event_index = next_index
+        self.current_event_index = self._index_by_id.get(id(next_event), -1)
         self._active_event_object = next_event
 
         # Emit signals to start the event
@@ -376,22 +385,17 @@ class EventScheduler(QObject):
             event_data.get("description", ""),
         )
 
-        # Add to the correct specific list
-        if new_event.time:
-            self.scheduled_events.append(new_event)
-            self.scheduled_events.sort(key=lambda x: x.time)
-        else:
-            self.unscheduled_events.append(new_event)
-
-        # Rebuild main list
-        self.events = self.scheduled_events + self.unscheduled_events
+        # Insert into the correct specific list and the main list
+        self._insert_event(new_event)
 
         # Save changes
-        self.save_to_csv()
+        self._schedule_save()
 
         # Recalculate current state and emit updates
-        self._recalculate_current_index()  # Ensure index reflects potential shifts
-        self._update_state_after_event()  # Update countdown based on potential new schedule
+        now = datetime.now()
+        self._recalculate_current_index(now)  # Ensure index reflects potential shifts
+        # Update countdown based on potential new schedule
+        self._update_state_after_event(now)
         self._emit_update_signals()  # Notify UI
 
     def remove_event_at_index(self, index: int):
@@ -407,32 +411,25 @@ class EventScheduler(QObject):
 
             was_active_event = self._active_event_object is event_to_remove
 
-            # Remove from the specific list
-            if event_to_remove.time:
-                if event_to_remove in self.scheduled_events:
-                    self.scheduled_events.remove(event_to_remove)
-                # No need to re-sort scheduled list after removal
-            else:
-                if event_to_remove in self.unscheduled_events:
-                    self.unscheduled_events.remove(event_to_remove)
-
-            # Rebuild main list
-            self.events = self.scheduled_events + self.unscheduled_events
+            # Remove from the specific list and the main list
+            self._remove_event(index)
 
             # Save changes
-            self.save_to_csv()
+            self._schedule_save()
 
             # Update state *after* list modification
+            now = datetime.now()
             if was_active_event:
                 self._active_event_object = None  # Clear active event if it was removed
                 self.current_event_index = -1  # Reset index
-                self._recalculate_current_index()  # Try to find the logical new current index
+                # Try to find the logical new current index
+                self._recalculate_current_index(now)
             else:
                 # If the removed event wasn't active, the active event *might* still
                 # exist, but its index could have shifted.
-                self._recalculate_current_index()
+                self._recalculate_current_index(now)
 
-            self._update_state_after_event()  # Recalculate countdown etc.
+            self._update_state_after_event(now)  # Recalculate countdown etc.
             self._emit_update_signals()  # Notify UI
 
         else:
@@ -459,25 +456,24 @@ class EventScheduler(QObject):
 
         event_to_update = self.events[index]
         original_time = event_to_update.time  # Store original time for comparison
+        now = datetime.now()
         print(
             f"Updating field (col {column}) for event at index {index}: '{event_to_update.title}'"
         )
 
         try:
             if column == 1:  # Date column
-                if value.lower() == "unscheduled" or value == "":
+                if not value or value.lower() == _UNSCHEDULED_VALUE:
                     event_to_update.set_time(None)
                 elif event_to_update.time is None:
-                    now = datetime.now()
                     event_to_update.set_time(f"{value}T{now.strftime('%H:%M:%S')}")
                 else:
                     time_part = event_to_update.time.strftime("%H:%M:%S")
                     event_to_update.set_time(f"{value}T{time_part}")
             elif column == 2:  # Time column
-                if value.lower() == "unscheduled" or value == "":
+                if not value or value.lower() == _UNSCHEDULED_VALUE:
                     event_to_update.set_time(None)
                 elif event_to_update.time is None:
-                    now = datetime.now()
                     event_to_update.set_time(f"{now.strftime('%Y-%m-%d')}T{value}")
                 else:
                     date_part = event_to_update.time.strftime("%Y-%m-%d")
@@ -501,71 +497,61 @@ class EventScheduler(QObject):
             )
             return
 
-        # Check if the event's schedule status changed (scheduled <-> unscheduled) or time changed
-        time_changed = original_time != event_to_update.time
-        schedule_status_changed = (original_time is None) != (
-            event_to_update.time is None
-        )
-
-        if not (schedule_status_changed or time_changed):
+        # A change of schedule status (scheduled <-> unscheduled) is also a time change,
+        # so this one comparison decides whether the event has to move
+        if original_time == event_to_update.time:
             # Save changes regardless of whether time changed (e.g., title update)
-            self.save_to_csv()
-            # Recalculate current index as list order might have changed
-            self._recalculate_current_index()
-            # Schedule the UI update signals slightly later to avoid conflicts with table editor commits
-            QTimer.singleShot(0, self._emit_update_signals)
+            self._schedule_save()
+            # The list order is unchanged, but with no active event the current index
+            # follows the clock and may have moved on since the last refresh
+            previous_index = self.current_event_index
+            self._recalculate_current_index(now)
+            # Schedule the UI update slightly later to avoid conflicts with table editor commits
+            if self.current_event_index == previous_index:
+                self._schedule_event_changed(index)  # Only this row needs redrawing
+            else:
+                self._schedule_update_signals()
             return
 
-        # Need to potentially move event between lists and rebuild
-        # 1. Remove from original specific list
-        if original_time:
-            if event_to_update in self.scheduled_events:
-                # It might have been removed already if time changed and it was re-added below
-                # Check existence before removal
-                self.scheduled_events.remove(event_to_update)
-        else:
-            if event_to_update in self.unscheduled_events:
-                self.unscheduled_events.remove(event_to_update)
-
-        # 2. Add to the correct new specific list
-        if event_to_update.time:
-            self.scheduled_events.append(event_to_update)
-            self.scheduled_events.sort(key=lambda x: x.time)
-        else:
-            self.unscheduled_events.append(event_to_update)
+        # Move the event to its new position
+        # 1. Remove it from its original position
+        self._remove_event(index)
 
-        # 3. Rebuild main list
-        self.events = self.scheduled_events + self.unscheduled_events
+        # 2. Insert it at the position for its new time (or as unscheduled)
+        self._insert_event(event_to_update)
 
         # Save changes
-        self.save_to_csv()
+        self._schedule_save()
 
         # Recalculate current index as list order might have changed
-        self._recalculate_current_index()
+        self._recalculate_current_index(now)
 
         # Update countdown state if timing potentially changed
-        self._update_state_after_event()
+        self._update_state_after_event(now)
 
         # Schedule the UI update signals slightly later to avoid conflicts with table editor commits
-        QTimer.singleShot(0, self._emit_update_signals)
+        self._schedule_update_signals()
 
-    def _recalculate_current_index(self):
+    def _recalculate_current_index(self, now: datetime | None = None):
         """
         Finds the new index of the _active_event_object in the potentially modified self.events list.
         If _active_event_object is None or no longer exists, attempts to find the most recent past event.
         Updates self.current_event_index.
+
+        Args:
+            now: The current time, if the caller already has it.
         """
         if self._active_event_object:
-            try:
-                self.current_event_index = self.events.index(self._active_event_object)
-            except ValueError:
+            self.current_event_index = self._index_by_id.get(
+                id(self._active_event_object), -1
+            )
+            if self.current_event_index == -1:
                 # The active event is no longer in the list (removed or changed significantly?)
                 print(
                     f"Warning: Active event '{self._active_event_object.title}' not found after update/removal.",
                     file=sys.stderr,
                 )
                 self._active_event_object = None
-                self.current_event_index = -1
         else:
             # No active event, reset index
             self.current_event_index = -1
@@ -574,56 +560,176 @@ class EventScheduler(QObject):
         # try to find the most recent past event again based on the current time
         # This covers cases where adding/removing events changes what *should* be considered current
         if self.current_event_index == -1:
-            now = datetime.now().replace(tzinfo=None)
-            most_recent_past_scheduled_event: Event | None = None
-            most_recent_past_scheduled_event_index_in_all: int = -1
-
-            for event in (
-                self.scheduled_events
-            ):  # Iterate through the potentially updated sorted list
-                if event.time <= now:
-                    most_recent_past_scheduled_event = event
-                else:
-                    break  # Stop early
-
-            if most_recent_past_scheduled_event:
-                try:
-                    most_recent_past_scheduled_event_index_in_all = self.events.index(
-                        most_recent_past_scheduled_event
-                    )
-                    self.current_event_index = (
-                        most_recent_past_scheduled_event_index_in_all
-                    )
-                    # Should we reset _active_event_object here?
-                    # Let's assume _check_schedule or trigger_event will set the active object appropriately.
-                    # Setting it here might prematurely mark an event as active.
-                    print(
-                        f"Recalculated current index to {self.current_event_index} (event: {most_recent_past_scheduled_event.title})"
-                    )
-                except ValueError:
-                    print(
-                        "Error: Could not find recalculated past event in main list.",
-                        file=sys.stderr,
-                    )
-                    self.current_event_index = -1  # Stay at -1 if error
+            if now is None:
+                now = datetime.now()
+            most_recent_past_scheduled_event_index_in_all, _ = self._schedule_position(
+                now
+            )
+
+            if most_recent_past_scheduled_event_index_in_all >= 0:
+                self.current_event_index = most_recent_past_scheduled_event_index_in_all
+                # Should we reset _active_event_object here?
+                # Let's assume _tick_countdown or trigger_event will set the active object appropriately.
+                # Setting it here might prematurely mark an event as active.
+                print(
+                    f"Recalculated current index to {self.current_event_index} (event: {self.events[self.current_event_index].title})"
+                )
+
+    def _insert_event(self, event: Event) -> int:
+        """
+        Inserts an event into its specific list and into `self.events` in place,
+        keeping `_scheduled_times` and `_index_by_id` in sync.
+
+        Args:
+            event: The event to insert.
+
+        Returns:
+            The index of the event in `self.events`.
+        """
+        if event.time is not None:
+            # Insert in time order; ties go after existing events like a stable sort.
+            # Scheduled events lead self.events, so the position carries over.
+            index = bisect.bisect_right(self._scheduled_times, event.time)
+            self.scheduled_events.insert(index, event)
+            self._scheduled_times.insert(index, event.time)
+        else:
+            index = len(self.events)
+            self.unscheduled_events.append(event)
+        self.events.insert(index, event)
+        self._events_snapshot = None
+        self._reindex_from(index)
+        return index
+
+    def _remove_event(self, index: int) -> Event:
+        """
+        Removes the event at `index` from `self.events` and its specific list in
+        place, keeping `_scheduled_times` and `_index_by_id` in sync.
+
+        Args:
+            index: The index of the event in `self.events`.
+
+        Returns:
+            The removed Event.
+        """
+        # self.events is scheduled_events followed by unscheduled_events
+        scheduled_count = len(self.scheduled_events)
+        if index < scheduled_count:
+            del self.scheduled_events[index]
+            del self._scheduled_times[index]
+        else:
+            del self.unscheduled_events[index - scheduled_count]
+        event = self.events.pop(index)
+        self._events_snapshot = None
+        del self._index_by_id[id(event)]
+        self._reindex_from(index)
+        return event
+
+    def _reindex_from(self, start: int):
+        """Refreshes `_index_by_id` for the events at `start` and after."""
+        events = self.events
+        index_by_id = self._index_by_id
+        for i in range(start, len(events)):
+            index_by_id[id(events[i])] = i
+
+    def _rebuild_events(self):
+        """
+        Rebuilds the combined `self.events` list and the sorted time keys
+        from `self.scheduled_events` and `self.unscheduled_events`.
+        Used after a bulk load; single edits go through `_insert_event`/`_remove_event`.
+        """
+        self.events = self.scheduled_events + self.unscheduled_events
+        self._events_snapshot = None
+        self._scheduled_times = [event.time for event in self.scheduled_events]
+        self._index_by_id = {id(event): i for i, event in enumerate(self.events)}
+
+    def _schedule_update_signals(self):
+        """
+        Queues `_emit_update_signals` for the next event loop pass. Requests made
+        before it runs (e.g. several cell edits committed together) share one emission.
+        """
+        if self._update_signals_pending:
+            return
+        self._update_signals_pending = True
+        QTimer.singleShot(0, self._emit_update_signals)
+
+    def _schedule_event_changed(self, index: int):
+        """
+        Queues an `event_changed` emission for the next event loop pass, unless a
+        full refresh is already queued (it redraws that row anyway).
+
+        Args:
+            index: The index of the edited event in `self.events`.
+        """
+        if self._update_signals_pending:
+            return
+        QTimer.singleShot(0, lambda: self._emit_event_changed(index))
+
+    def _emit_event_changed(self, index: int):
+        """Emits `event_changed` unless a full refresh was queued in the meantime."""
+        # A queued full refresh means the list may have moved, so the index could be stale
+        if not self._update_signals_pending:
+            self.event_changed.emit(index)
 
     def _emit_update_signals(self):
         """Emits signals to notify UI about the current state."""
-        self.all_events_signal.emit(self.events)
+        self._update_signals_pending = False
+        # Hand out a snapshot so receivers never observe later list mutations.
+        # It is only rebuilt after the list changes, not on every refresh.
+        if self._events_snapshot is None:
+            self._events_snapshot = tuple(self.events)
+        self.all_events_signal.emit(self._events_snapshot)
         self.current_event_signal.emit(self.current_event_index)
 
     # --- Persistence ---
 
+    def _schedule_save(self):
+        """
+        Requests a save once edits have been quiet for `_SAVE_DEBOUNCE_MS`,
+        so a burst of edits results in a single CSV write.
+        """
+        self._save_timer.start(_SAVE_DEBOUNCE_MS)
+
     def save_to_csv(self):
-        """Saves the current state of all events back to the loaded CSV file."""
-        if self.csv_path:
-            try:
-                CSVManager.save_events(self.csv_path, self.events)
-                print(f"Events saved to {self.csv_path}")
-            except Exception as e:
-                print(f"Error saving events to {self.csv_path}: {e}", file=sys.stderr)
-        else:
+        """
+        Saves the current state of all events back to the loaded CSV file.
+
+        The rows are captured here on the GUI thread; the file is written by the
+        save pool's worker thread.
+        """
+        if not self.csv_path:
             print("Error: Cannot save events, CSV path not set.", file=sys.stderr)
+            return
+
+        rows = CSVManager.events_to_rows(self.events)
+        with self._save_lock:
+            save_queued = self._pending_save is not None
+            self._pending_save = (self.csv_path, rows)
+        if not save_queued:
+            self._save_pool.start(_CSVSaveTask(self._write_pending_save))
+
+    def _write_pending_save(self):
+        """Writes the most recently queued rows. Runs on the save pool's thread."""
+        with self._save_lock:
+            pending, self._pending_save = self._pending_save, None
+        if pending is None:
+            return
+
+        csv_path, rows = pending
+        try:
+            CSVManager.save_rows(csv_path, rows)
+            print(f"Events saved to {csv_path}")
+        except Exception as e:
+            print(f"Error saving events to {csv_path}: {e}", file=sys.stderr)
+
+    def wait_for_pending_saves(self):
+        """
+        Writes any debounced save now and blocks until all queued CSV writes
+        have finished. Call before exiting.
+        """
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self.save_to_csv()
+        self._save_pool.waitForDone()
 
     def next_event(
         self, reference_time: datetime | None = None
@@ -638,21 +744,6 @@ class EventScheduler(QObject):
             tuple[Event | None, int]: The next event and its index in self.events, or (None, -1) if no next event
         """
         if reference_time is None:
-            reference_time = datetime.now().replace(tzinfo=None)
-
-        next_event = None
-        next_index = -1
-        min_seconds = float("inf")
-
-        for i, event in enumerate(self.events):
-            seconds_until = event.seconds_until(reference_time)
-            if (
-                seconds_until is not None
-                and seconds_until > 0
-                and seconds_until < min_seconds
-            ):
-                next_event = event
-                next_index = i
-                min_seconds = seconds_until
-
-        return next_event, next_index
+            reference_time = datetime.now()
+
+        return self._find_next_scheduled_event(reference_time)
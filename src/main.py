@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 import sys
-import os
 import argparse
 from PySide6.QtWidgets import QApplication
 from src.visual_window import VisualWindow
@@ -16,10 +15,17 @@ def main():
     parser.add_argument("csv_path", help="Path to schedule CSV file (required)")
     args = parser.parse_args()
 
-    # Validate that CSV file exists
     csv_path = args.csv_path
-    if not os.path.exists(csv_path):
-        print(f"Error: CSV file not found: {csv_path}")
+    print(f"Using CSV file: {csv_path}")
+
+    # Create event scheduler
+    scheduler = EventScheduler()
+
+    # Load CSV before building any UI so a bad path fails without side effects
+    # (the scheduler reports a missing or invalid file itself)
+    try:
+        scheduler.load_events_from_csv(csv_path)
+    except (OSError, ValueError):
         return 1
 
     app = QApplication(sys.argv[1:])  # Skip the command line args we process ourselves
@@ -28,9 +34,6 @@ def main():
     visual_window = VisualWindow()
     console_window = ConsoleWindow()
 
-    # Create event scheduler
-    scheduler = EventScheduler()
-
     # Connect signals
     # Scheduler -> VisualWindow
     scheduler.event_started.connect(visual_window.play_video)
@@ -39,6 +42,7 @@ def main():
 
     # Scheduler -> ConsoleWindow (Display Updates)
     scheduler.all_events_signal.connect(console_window.update_events_display)
+    scheduler.event_changed.connect(console_window.update_event_row)
     scheduler.current_event_signal.connect(console_window.update_current_event)
 
     # ConsoleWindow -> Scheduler (Requests & Triggers)
@@ -53,16 +57,6 @@ def main():
     # ConsoleWindow -> VisualWindow (Text Updates)
     console_window.text_updated.connect(visual_window.update_text)
 
-    print(f"Using CSV file: {csv_path}")
-
-    # Create directory if needed
-    data_dir = os.path.dirname(csv_path)
-    if data_dir and not os.path.exists(data_dir):
-        os.makedirs(data_dir)
-
-    # Load CSV in scheduler
-    scheduler.load_events_from_csv(csv_path)
-
     # Save the CSV path to the console window
     console_window.csv_path = csv_path
 
@@ -73,7 +67,12 @@ def main():
     # Start the scheduler
     scheduler.start()
 
-    return app.exec()
+    exit_code = app.exec()
+
+    # Let any in-flight CSV save finish before the process exits
+    scheduler.wait_for_pending_saves()
+
+    return exit_code
 
 
 if __name__ == "__main__":
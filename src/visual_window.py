@@ -1,3 +1,5 @@
+import functools
+
 from PySide6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QLabel, QSizePolicy
 from PySide6.QtCore import Qt, QUrl, QCoreApplication, Signal
 from PySide6.QtGui import QFont, QColor, QPalette
@@ -5,6 +7,61 @@ from PySide6.QtMultimedia import QMediaPlayer
 from PySide6.QtMultimediaWidgets import QVideoWidget
 from .strings import WINDOW_TITLE, DEFAULT_TITLE, DEFAULT_DESCRIPTION
 
+# Label styles with a modern look
+_TITLE_STYLE = """
+    color: #FFFFFF;
+    border-bottom: 2px solid #4A88FF;
+    padding-bottom: 10px;
+    margin-bottom: 10px;
+"""
+_DESCRIPTION_STYLE = """
+    color: #A7C7FF;
+    padding: 10px;
+"""
+_COUNTDOWN_HEADING_STYLE = "color: #FF9D7A;"
+_COUNTDOWN_STYLE = """
+    color: #4AE0E0;
+    background-color: rgba(20, 35, 60, 0.7);
+    padding: 15px;
+    border: 1px solid #4A88FF;
+"""
+_COUNTDOWN_WIDGET_STYLE = """
+    background-color: #17273A;
+    padding: 20px;
+"""
+
+
+# QFont and QPalette need a QGuiApplication, so these are built on first use
+# rather than at import time, then shared by every window
+@functools.cache
+def _label_font(point_size: int, bold: bool = False, italic: bool = False) -> QFont:
+    """Returns the shared font for a label of the given size and style."""
+    font = QFont()
+    font.setPointSize(point_size)
+    font.setBold(bold)
+    font.setItalic(italic)
+    return font
+
+
+@functools.cache
+def _dark_palette() -> QPalette:
+    """Returns the shared dark blue window palette."""
+    palette = QPalette()
+    # Dark blue background
+    palette.setColor(QPalette.Window, QColor(15, 25, 45))
+    palette.setColor(QPalette.WindowText, QColor(230, 230, 255))
+    palette.setColor(QPalette.Base, QColor(20, 30, 50))
+    palette.setColor(QPalette.AlternateBase, QColor(30, 40, 60))
+    palette.setColor(QPalette.ToolTipBase, QColor(240, 240, 255))
+    palette.setColor(QPalette.ToolTipText, QColor(240, 240, 255))
+    palette.setColor(QPalette.Text, QColor(220, 220, 250))
+    palette.setColor(QPalette.Button, QColor(30, 40, 65))
+    palette.setColor(QPalette.ButtonText, QColor(230, 230, 255))
+    palette.setColor(QPalette.BrightText, QColor(255, 120, 120))
+    palette.setColor(QPalette.Highlight, QColor(65, 155, 255))
+    palette.setColor(QPalette.HighlightedText, QColor(15, 15, 35))
+    return palette
+
 
 class VisualWindow(QMainWindow):
     # Signal emitted when video playback ends
@@ -23,20 +80,12 @@ class VisualWindow(QMainWindow):
 
         # Create layout
         main_layout = QVBoxLayout(central_widget)
+        self.main_layout = main_layout
 
-        # Create video widget
-        self.video_widget = QVideoWidget()
-        self.video_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        main_layout.addWidget(self.video_widget, 3)
-
-        # Create media player
-        self.media_player = QMediaPlayer()
-        self.media_player.setVideoOutput(self.video_widget)
-
-        # Connect the media player's playback state change to our handler
-        self.media_player.playbackStateChanged.connect(
-            self.handle_playback_state_change
-        )
+        # The video widget and media player are created on first playback
+        # (see _ensure_video), so startup does not initialize the multimedia backend
+        self.video_widget = None
+        self.media_player = None
 
         # Create countdown widget
         self.countdown_widget = QWidget()
@@ -45,20 +94,14 @@ class VisualWindow(QMainWindow):
         # Add title label
         self.title_label = QLabel(DEFAULT_TITLE)
         self.title_label.setAlignment(Qt.AlignCenter)
-        title_font = QFont()
-        title_font.setPointSize(60)
-        title_font.setBold(True)
-        self.title_label.setFont(title_font)
+        self.title_label.setFont(_label_font(60, bold=True))
         countdown_layout.addWidget(self.title_label)
 
         # Add description label
         self.description_label = QLabel(DEFAULT_DESCRIPTION)
         self.description_label.setAlignment(Qt.AlignCenter)
         self.description_label.setWordWrap(True)
-        desc_font = QFont()
-        desc_font.setPointSize(18)
-        desc_font.setItalic(True)
-        self.description_label.setFont(desc_font)
+        self.description_label.setFont(_label_font(18, italic=True))
         countdown_layout.addWidget(self.description_label)
 
         # Add separator
@@ -70,23 +113,18 @@ class VisualWindow(QMainWindow):
         self.countdown_heading = QLabel("Next event in:")
         self.countdown_heading.setAlignment(Qt.AlignCenter)
         self.countdown_heading.setFixedHeight(60)
-        countdown_font = QFont()
-        countdown_font.setPointSize(16)
-        self.countdown_heading.setFont(countdown_font)
+        self.countdown_heading.setFont(_label_font(16))
         countdown_layout.addWidget(self.countdown_heading)
 
         self.countdown_label = QLabel("--:--:--")
+        self._last_countdown_text = None  # Skips setText when the value is unchanged
         self.countdown_label.setAlignment(Qt.AlignCenter)
-        time_font = QFont()
-        time_font.setPointSize(54)
-        time_font.setBold(True)
-        self.countdown_label.setFont(time_font)
+        self.countdown_label.setFont(_label_font(54, bold=True))
         countdown_layout.addWidget(self.countdown_label)
 
         main_layout.addWidget(self.countdown_widget, 2)
 
-        # Initially hide video widget and show countdown widget
-        self.video_widget.hide()
+        # Initially show the countdown widget
         self.countdown_widget.show()
 
         # Set a dark theme
@@ -96,52 +134,40 @@ class VisualWindow(QMainWindow):
         self.current_title = DEFAULT_TITLE
         self.current_description = DEFAULT_DESCRIPTION
 
+    def _ensure_video(self):
+        """Creates the video widget and media player if they do not exist yet."""
+        if self.video_widget is not None:
+            return
+
+        # Create video widget above the countdown widget
+        self.video_widget = QVideoWidget()
+        self.video_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.main_layout.insertWidget(0, self.video_widget, 3)
+
+        # Create media player
+        self.media_player = QMediaPlayer()
+        self.media_player.setVideoOutput(self.video_widget)
+
+        # Connect the media player's playback state change to our handler
+        self.media_player.playbackStateChanged.connect(
+            self.handle_playback_state_change
+        )
+
     def set_dark_theme(self):
-        palette = QPalette()
-        # Dark blue background
-        palette.setColor(QPalette.Window, QColor(15, 25, 45))
-        palette.setColor(QPalette.WindowText, QColor(230, 230, 255))
-        palette.setColor(QPalette.Base, QColor(20, 30, 50))
-        palette.setColor(QPalette.AlternateBase, QColor(30, 40, 60))
-        palette.setColor(QPalette.ToolTipBase, QColor(240, 240, 255))
-        palette.setColor(QPalette.ToolTipText, QColor(240, 240, 255))
-        palette.setColor(QPalette.Text, QColor(220, 220, 250))
-        palette.setColor(QPalette.Button, QColor(30, 40, 65))
-        palette.setColor(QPalette.ButtonText, QColor(230, 230, 255))
-        palette.setColor(QPalette.BrightText, QColor(255, 120, 120))
-        palette.setColor(QPalette.Highlight, QColor(65, 155, 255))
-        palette.setColor(QPalette.HighlightedText, QColor(15, 15, 35))
-        self.setPalette(palette)
-
-        # Set specific colors and styles for the labels with a modern look
-        self.title_label.setStyleSheet("""
-            color: #FFFFFF;
-            border-bottom: 2px solid #4A88FF;
-            padding-bottom: 10px;
-            margin-bottom: 10px;
-        """)
-
-        self.description_label.setStyleSheet("""
-            color: #A7C7FF;
-            padding: 10px;
-        """)
-
-        self.countdown_heading.setStyleSheet("color: #FF9D7A;")
-
-        self.countdown_label.setStyleSheet("""
-            color: #4AE0E0;
-            background-color: rgba(20, 35, 60, 0.7);
-            padding: 15px;
-            border: 1px solid #4A88FF;
-        """)
+        self.setPalette(_dark_palette())
+
+        # Set specific colors and styles for the labels
+        self.title_label.setStyleSheet(_TITLE_STYLE)
+        self.description_label.setStyleSheet(_DESCRIPTION_STYLE)
+        self.countdown_heading.setStyleSheet(_COUNTDOWN_HEADING_STYLE)
+        self.countdown_label.setStyleSheet(_COUNTDOWN_STYLE)
 
         # Apply style to countdown widget background
-        self.countdown_widget.setStyleSheet("""
-            background-color: #17273A;
-            padding: 20px;
-        """)
+        self.countdown_widget.setStyleSheet(_COUNTDOWN_WIDGET_STYLE)
 
     def play_video(self, video_path, title, description):
+        self._ensure_video()
+
         # Update labels and current event info
         self.current_title = title
         self.current_description = description
@@ -164,7 +190,8 @@ class VisualWindow(QMainWindow):
         self, next_title, seconds_to_next, current_title=None, current_description=None
     ):
         # Hide video widget, show countdown
-        self.video_widget.hide()
+        if self.video_widget is not None:
+            self.video_widget.hide()
         self.countdown_widget.show()
 
         # If provided, update the current event info
@@ -183,16 +210,21 @@ class VisualWindow(QMainWindow):
     def update_countdown(self, seconds):
         hours, remainder = divmod(seconds, 3600)
         minutes, seconds = divmod(remainder, 60)
-        self.countdown_label.setText(f"{hours:02}:{minutes:02}:{seconds:02}")
+        text = f"{hours:02}:{minutes:02}:{seconds:02}"
+        if text != self._last_countdown_text:
+            self.countdown_label.setText(text)
+            self._last_countdown_text = text
 
     def update_text(self, title, description):
         """
         Updates just the title and description text without affecting other UI elements.
         """
-        if title:
+        # The labels always show current_title/current_description, so equal
+        # text means there is nothing to redraw
+        if title and title != self.current_title:
             self.current_title = title
             self.title_label.setText(title)
-        if description:
+        if description and description != self.current_description:
             self.current_description = description
             self.description_label.setText(description)
 